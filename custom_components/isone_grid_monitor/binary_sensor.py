@@ -1,7 +1,9 @@
 """Binary sensor platform for ISO-NE Grid Monitor."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.binary_sensor import (
@@ -9,7 +11,7 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -18,12 +20,19 @@ from .const import (
     ATTR_SEVERITY,
     ATTR_DESCRIPTION,
     ATTR_STATUS,
+    ATTR_EEA_LEVEL,
     SEVERITY_POWER_WARNING,
 )
 from .coordinator import ISONEDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Marks a cache that has not been filled yet
+_UNSET = object()
+
+# Shared attributes for a sensor without data
+_EMPTY_ATTRS: Mapping[str, Any] = MappingProxyType({})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -57,50 +66,45 @@ class ISONEGridEmergencyBinarySensor(CoordinatorEntity, BinarySensorEntity):
         super().__init__(coordinator)
         self._entry = entry
         self._attr_unique_id = f"{entry.entry_id}_grid_emergency"
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "ISO-NE Grid Monitor",
-            "manufacturer": "ISO New England",
-            "model": "Grid Status Monitor",
-            "sw_version": "1.0.0",
-        }
+        self._attr_device_info = coordinator.device_info
+        # Snapshot the current state was computed from
+        self._snapshot_source: Any = _UNSET
 
-    @property
-    def is_on(self) -> bool:
-        """Return true if grid emergency is active."""
-        if not self.coordinator.data:
-            return False
-        
-        parsed_status = self.coordinator.data.get("parsed_status", {})
-        return parsed_status.get("is_emergency", False)
+    def _refresh(self) -> None:
+        """Recompute the state, attributes and icon from the coordinator snapshot."""
+        snapshot = self.coordinator.snapshot
+        if snapshot is self._snapshot_source:
+            return
+        self._snapshot_source = snapshot
+        self._attr_is_on, self._attr_extra_state_attributes = self._compute()
+        self._attr_icon = "mdi:alert-circle" if self._attr_is_on else "mdi:check-circle"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+    def _compute(self) -> tuple[bool, Mapping[str, Any]]:
+        """Return whether a grid emergency is active and the status details."""
         if not self.coordinator.data:
-            return {}
+            return False, _EMPTY_ATTRS
         
-        parsed_status = self.coordinator.data.get("parsed_status", {})
+        snapshot = self.coordinator.snapshot
+        op4_action = snapshot.op4_action
+        eea_level = snapshot.eea_level
         
-        attrs = {
-            ATTR_STATUS: parsed_status.get("status", "Unknown"),
-            ATTR_SEVERITY: parsed_status.get("severity", 0),
-            ATTR_DESCRIPTION: parsed_status.get("description", ""),
+        # Single literal so the dict is allocated at its final size; the
+        # OP-4 action and EEA level are only included when present
+        return snapshot.is_emergency, {
+            ATTR_STATUS: snapshot.status,
+            ATTR_SEVERITY: snapshot.severity,
+            ATTR_DESCRIPTION: snapshot.description,
+            **({"op4_action": op4_action} if op4_action else {}),
+            **({ATTR_EEA_LEVEL: eea_level} if eea_level else {}),
         }
-        
-        # Add OP-4 action if present
-        if parsed_status.get("op4_action"):
-            attrs["op4_action"] = parsed_status["op4_action"]
-        
-        # Add EEA level if present
-        if parsed_status.get("eea_level"):
-            attrs["eea_level"] = parsed_status["eea_level"]
-        
-        return attrs
-
-    @property
-    def icon(self) -> str:
-        """Return the icon to use in the frontend."""
-        if self.is_on:
-            return "mdi:alert-circle"
-        return "mdi:check-circle"
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state once the entity is added."""
+        await super().async_added_to_hass()
+        self._refresh()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the state before writing it."""
+        self._refresh()
+        super()._handle_coordinator_update()
@@ -18,13 +18,40 @@ from .const import (
     CONF_MONITOR_SYSTEMWIDE,
     DEFAULT_UPDATE_INTERVAL,
     DEFAULT_ZONE,
-    ZONES,
+    ZONE_KEYS,
     MIN_UPDATE_INTERVAL,
     MAX_UPDATE_INTERVAL,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# Validators and the user step schema are built once at import
+_ZONE_VALIDATOR = vol.In(ZONE_KEYS)
+_INTERVAL_VALIDATOR = vol.All(
+    vol.Coerce(int), vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)
+)
+
+_STATIC_SCHEMA = vol.Schema(
+    {
+        vol.Optional(CONF_MONITOR_SYSTEMWIDE, default=True): cv.boolean,
+        vol.Optional(CONF_ZONE, default=DEFAULT_ZONE): _ZONE_VALIDATOR,
+        vol.Optional(
+            CONF_UPDATE_INTERVAL, default=DEFAULT_UPDATE_INTERVAL
+        ): _INTERVAL_VALIDATOR,
+    }
+)
+
+
+def _options_schema(systemwide: bool, zone: str, interval: int) -> vol.Schema:
+    """Return the options schema defaulted to an entry's current values."""
+    return vol.Schema(
+        {
+            vol.Optional(CONF_MONITOR_SYSTEMWIDE, default=systemwide): cv.boolean,
+            vol.Optional(CONF_ZONE, default=zone): _ZONE_VALIDATOR,
+            vol.Optional(CONF_UPDATE_INTERVAL, default=interval): _INTERVAL_VALIDATOR,
+        }
+    )
+
 
 class ISONEConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for ISO-NE Grid Monitor."""
@@ -35,43 +62,17 @@ class ISONEConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Handle the initial step."""
-        errors: dict[str, str] = {}
-
         if user_input is not None:
-            # Validate update interval
-            update_interval = user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-            if not MIN_UPDATE_INTERVAL <= update_interval <= MAX_UPDATE_INTERVAL:
-                errors[CONF_UPDATE_INTERVAL] = "invalid_update_interval"
-            
-            if not errors:
-                # Create entry
-                return self.async_create_entry(
-                    title=f"ISO-NE Grid Monitor ({user_input.get(CONF_ZONE, 'System-wide')})",
-                    data=user_input,
-                )
+            # Update interval bounds are enforced by _INTERVAL_VALIDATOR
+            return self.async_create_entry(
+                title=f"ISO-NE Grid Monitor ({user_input.get(CONF_ZONE, 'System-wide')})",
+                data=user_input,
+            )
 
         # Show form
-        data_schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_MONITOR_SYSTEMWIDE, 
-                    default=True
-                ): cv.boolean,
-                vol.Optional(
-                    CONF_ZONE, 
-                    default=DEFAULT_ZONE
-                ): vol.In(list(ZONES.keys())),
-                vol.Optional(
-                    CONF_UPDATE_INTERVAL, 
-                    default=DEFAULT_UPDATE_INTERVAL
-                ): vol.All(vol.Coerce(int), vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)),
-            }
-        )
-
         return self.async_show_form(
             step_id="user",
-            data_schema=data_schema,
-            errors=errors,
+            data_schema=_STATIC_SCHEMA,
         )
 
     @staticmethod
@@ -94,42 +95,18 @@ class ISONEOptionsFlowHandler(config_entries.OptionsFlow):
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
         """Manage the options."""
-        errors: dict[str, str] = {}
-
         if user_input is not None:
-            # Validate update interval
-            update_interval = user_input.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
-            if not MIN_UPDATE_INTERVAL <= update_interval <= MAX_UPDATE_INTERVAL:
-                errors[CONF_UPDATE_INTERVAL] = "invalid_update_interval"
-            
-            if not errors:
-                # Update entry
-                return self.async_create_entry(title="", data=user_input)
+            # Update interval bounds are enforced by _INTERVAL_VALIDATOR
+            return self.async_create_entry(title="", data=user_input)
 
         # Get current values
         current_zone = self.config_entry.data.get(CONF_ZONE, DEFAULT_ZONE)
         current_interval = self.config_entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
         current_systemwide = self.config_entry.data.get(CONF_MONITOR_SYSTEMWIDE, True)
 
-        data_schema = vol.Schema(
-            {
-                vol.Optional(
-                    CONF_MONITOR_SYSTEMWIDE,
-                    default=current_systemwide
-                ): cv.boolean,
-                vol.Optional(
-                    CONF_ZONE,
-                    default=current_zone
-                ): vol.In(list(ZONES.keys())),
-                vol.Optional(
-                    CONF_UPDATE_INTERVAL,
-                    default=current_interval
-                ): vol.All(vol.Coerce(int), vol.Range(min=MIN_UPDATE_INTERVAL, max=MAX_UPDATE_INTERVAL)),
-            }
-        )
-
         return self.async_show_form(
             step_id="init",
-            data_schema=data_schema,
-            errors=errors,
+            data_schema=_options_schema(
+                current_systemwide, current_zone, current_interval
+            ),
         )
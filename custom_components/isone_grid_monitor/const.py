@@ -1,4 +1,6 @@
 """Constants for the ISO-NE Grid Monitor integration."""
+from __future__ import annotations
+
 from typing import Final
 
 # Integration domain
@@ -25,6 +27,12 @@ ZONES: Final = {
     "NEMASSBOST": ".Z.NEMASSBOST",
 }
 
+# Zone names in display order, frozen once for the config flow selector
+ZONE_KEYS: Final = tuple(ZONES.keys())
+
+# Zone names for O(1) membership checks (unordered, so not for UI selectors)
+ZONE_NAME_SET: Final = frozenset(ZONES)
+
 ZONE_IDS: Final = {
     ".Z.MAINE": 4001,
     ".Z.NEWHAMPSHIRE": 4002,
@@ -45,20 +53,21 @@ STATUS_EEA1: Final = "EEA Level 1"
 STATUS_EEA2: Final = "EEA Level 2"
 STATUS_EEA3: Final = "EEA Level 3"
 
-# OP-4 Actions
-OP4_ACTIONS: Final = {
-    1: "Power Caution - Resources Notified",
-    2: "EEA Level 1 Declared",
-    3: "Voluntary Load Curtailment Requested",
-    4: "Power Watch - Conservation May Be Needed",
-    5: "30-Minute Reserve Depletion",
-    6: "Demand Response - 2hr Block A",
-    7: "Demand Response - 2hr Block B",
-    8: "5% Voltage Reduction / EEA Level 2",
-    9: "Customer Generation & Industrial Curtailment",
-    10: "Power Warning - Immediate Reduction Needed",
-    11: "Governor Appeals / Load Shed Preparation",
-}
+# OP-4 Actions, indexed by action number (index 0 is unused)
+OP4_ACTIONS: Final = (
+    None,
+    "Power Caution - Resources Notified",
+    "EEA Level 1 Declared",
+    "Voluntary Load Curtailment Requested",
+    "Power Watch - Conservation May Be Needed",
+    "30-Minute Reserve Depletion",
+    "Demand Response - 2hr Block A",
+    "Demand Response - 2hr Block B",
+    "5% Voltage Reduction / EEA Level 2",
+    "Customer Generation & Industrial Curtailment",
+    "Power Warning - Immediate Reduction Needed",
+    "Governor Appeals / Load Shed Preparation",
+)
 
 # Alert severity levels (0-5)
 SEVERITY_NORMAL: Final = 0
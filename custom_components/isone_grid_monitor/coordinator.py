@@ -1,19 +1,24 @@
 """Data coordinator for ISO-NE Grid Monitor."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
-import logging
-from typing import Any
-import aiohttp
-import pandas as pd
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import csv
+from datetime import date, datetime, timedelta
 import io
-import re
+import logging
+from types import MappingProxyType
+from typing import Any, Callable, Mapping, NamedTuple, TypeVar
 
+import aiohttp
 import gridstatus
 from gridstatus import ISONE
+import numpy as np
+import pandas as pd
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 from homeassistant.exceptions import ConfigEntryAuthFailed
 
@@ -25,22 +30,99 @@ from .const import (
     DEFAULT_UPDATE_INTERVAL,
     ZONES,
     STATUS_NORMAL,
-    STATUS_MLCC2,
-    STATUS_OP4,
-    STATUS_OP7,
-    STATUS_EEA1,
-    STATUS_EEA2,
-    STATUS_EEA3,
     SEVERITY_NORMAL,
-    SEVERITY_MLCC2,
-    SEVERITY_OP4_EARLY,
-    SEVERITY_POWER_WATCH,
-    SEVERITY_POWER_WARNING,
-    SEVERITY_EMERGENCY,
+    ATTR_LOAD_MW,
 )
+from .parsing import get_op4_action, parse_status
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Tail of the zone load CSV requested once the header row is known; covers
+# the last several 5-minute rows
+_ZONE_CSV_TAIL_BYTES = 8192
+
+# Refresh intervals (seconds) for total load and the zone load and seven-day
+# forecast CSVs, and the cap on how far repeated failures push back the next
+# attempt
+_LOAD_TTL = 300
+_ZONE_CSV_TTL = 600
+_SDF_CSV_TTL = 1800
+_MAX_BACKOFF_SECONDS = 7200
+
+# Total load's refresh interval equals the default poll period, so allow for
+# scheduling jitter or every other default poll would skip the fetch
+_LOAD_TTL_SLACK = 15
+
+# Upper bound on a CSV report body; anything larger is not a real report
+_MAX_CSV_BYTES = 50_000_000
+
+
+class ISONESnapshot(NamedTuple):
+    """Sections of the latest coordinator data, extracted once per update.
+
+    The load readings and parsed status fields are flattened so entities
+    read them as attributes; their defaults match an update with no data.
+    """
+
+    forecast_alerts: Mapping[str, Any]
+    capacity: float | None
+    capacity_margin: float | None
+    capacity_breakdown: Mapping[str, float] | None = None
+    total_load: float | None = None
+    load_timestamp: Any = None
+    zone_load: float | None = None
+    status: str = STATUS_NORMAL
+    severity: int = SEVERITY_NORMAL
+    op4_action: int | None = None
+    op4_description: str | None = None
+    eea_level: int | None = None
+    description: str = ""
+    is_emergency: bool = False
+
+
+# Snapshot used before the first successful update
+_EMPTY_SNAPSHOT = ISONESnapshot(MappingProxyType({}), None, None)
+
+
+def _parse_sdf_csv(csv_text: str) -> tuple[list[str], dict[str, list[str]]]:
+    """Split an ISO-NE seven-day forecast CSV into day headers and data rows.
+
+    The report mixes comment (C), header (H) and data (D) rows of different
+    widths, so it is tokenized with the stdlib csv reader, which handles the
+    quoted, comma-grouped numbers in C rather than a regex per line.
+    """
+    days: list[str] = []
+    data: dict[str, list[str]] = {}
+    
+    for row in csv.reader(io.StringIO(csv_text)):
+        if not row:
+            continue
+        
+        if row[0] == "H" and len(row) > 2:
+            days = row[2:]
+        elif row[0] == "D" and len(row) > 2 and row[1]:
+            data[row[1]] = row[2:]
+    
+    return days, data
+
+
+async def _read_csv_body(response: aiohttp.ClientResponse) -> bytes:
+    """Read a CSV response body as bytes, rejecting oversized responses."""
+    if response.content_length is not None and response.content_length > _MAX_CSV_BYTES:
+        raise ValueError(f"CSV response too large: {response.content_length} bytes")
+    body = await response.read()
+    if len(body) > _MAX_CSV_BYTES:
+        raise ValueError(f"CSV response too large: {len(body)} bytes")
+    return body
+
+
+def _sdf_row_to_mw(values: list[str], days: int) -> np.ndarray:
+    """Convert up to ``days`` cells of a forecast row to MW, NaN where not numeric."""
+    cells = pd.Series(values[:days], dtype=object).str.replace(",", "", regex=False)
+    return pd.to_numeric(cells, errors="coerce").to_numpy(dtype=float)
+
 
 class ISONEDataCoordinator(DataUpdateCoordinator):
     """Class to manage fetching ISO-NE data."""
@@ -49,6 +131,11 @@ class ISONEDataCoordinator(DataUpdateCoordinator):
         """Initialize the coordinator."""
         self.entry = entry
         self.isone = ISONE()
+        # Shared Home Assistant session so connections to iso-ne.com are pooled
+        self.session = async_get_clientsession(hass)
+        # Blocking gridstatus calls run on a private pool so a busy shared
+        # executor does not delay them
+        self._executor = ThreadPoolExecutor(max_workers=2, thread_name_prefix="isone")
         
         # Get config values
         update_interval = entry.data.get(CONF_UPDATE_INTERVAL, DEFAULT_UPDATE_INTERVAL)
@@ -56,12 +143,48 @@ class ISONEDataCoordinator(DataUpdateCoordinator):
         self.zone_code = ZONES.get(self.zone) if self.zone else None
         self.monitor_systemwide = entry.data.get(CONF_MONITOR_SYSTEMWIDE, True)
         
-        # Track last update times for CSV data
+        # Device shared by every entity of this entry; setup fills in the
+        # sw_version from the integration manifest
+        self.device_info: dict[str, Any] = {
+            "identifiers": {(DOMAIN, entry.entry_id)},
+            "name": "ISO-NE Grid Monitor",
+            "manufacturer": "ISO New England",
+            "model": "Grid Status Monitor",
+        }
+        
+        # Track last update times for total load and CSV data
+        self.last_load_update = None
         self.last_zone_update = None
         self.last_capacity_update = None
+        self.last_capacity_update_iso: str | None = None
         self.last_forecast_update = None
         
-        # Cached CSV data
+        # Zone load CSV column index keyed by the header it was found in, and
+        # today's header row
+        self._zone_column: tuple[tuple[str, ...], int] | None = None
+        self._zone_csv_header: tuple[str, bytes] | None = None
+        
+        # Last validators and parsed result per CSV report ("zone_load", "sdf"):
+        # kind -> (url, ETag, Last-Modified, parsed value)
+        self._http_cache: dict[str, tuple[str, str | None, str | None, Any]] = {}
+        
+        # gridstatus load frame columns and the positions of Load and Time
+        self._load_columns: tuple[tuple[str, ...], int | None, int | None] | None = None
+        
+        # Backoff per failing CSV report ("zone_load", "sdf"):
+        # kind -> (url, consecutive failures, next attempt time); a new day's
+        # URL starts fresh and replaces the entry
+        self._fail_backoff: dict[str, tuple[str, int, datetime]] = {}
+        
+        # Report date for CSV URLs, formatted once per day
+        self._date_str: str | None = None
+        self._date_str_day: date | None = None
+        
+        # Sections of the latest data for entities to read
+        self.snapshot = _EMPTY_SNAPSHOT
+        
+        # Cached total load reading and CSV data
+        self.cached_load: dict[str, Any] = {}
         self.cached_zone_load = None
         self.cached_capacity = None
         self.cached_forecast_alerts = None
@@ -71,64 +194,137 @@ class ISONEDataCoordinator(DataUpdateCoordinator):
             _LOGGER,
             name=DOMAIN,
             update_interval=timedelta(minutes=update_interval),
+            # Listeners are only notified when the fetched data changed
+            always_update=False,
         )
 
+    def _async_run_blocking(self, func: Callable[[], _T]) -> asyncio.Future[_T]:
+        """Run a blocking gridstatus call on the coordinator's executor."""
+        return self.hass.loop.run_in_executor(self._executor, func)
+
+    @callback
+    def async_stop_executor(self, _event: Event | None = None) -> None:
+        """Stop the gridstatus executor without waiting for running calls."""
+        self._executor.shutdown(wait=False)
+
+    async def async_config_entry_first_refresh(self) -> None:
+        """Run the first refresh, stopping the executor if setup fails.
+
+        A failed first refresh means the entry is never unloaded, so the
+        executor would otherwise leak on every setup retry.
+        """
+        try:
+            await super().async_config_entry_first_refresh()
+        except BaseException:
+            self.async_stop_executor()
+            raise
+
+    async def async_shutdown(self) -> None:
+        """Cancel listeners and stop the gridstatus executor."""
+        await super().async_shutdown()
+        self.async_stop_executor()
+
     async def _async_update_data(self) -> dict[str, Any]:
         """Fetch data from ISO-NE via gridstatus and CSV."""
         try:
             data = {}
             now = datetime.now()
             
-            # Get system status via HTML scraping (more reliable than API)
-            _LOGGER.debug("Fetching ISO-NE system status from website")
-            status_data = await self._get_status_from_web()
-            data["status"] = status_data
-            
-            # Get total load (every update - 5 min)
-            _LOGGER.debug("Fetching ISO-NE total load")
-            load_data = await self.hass.async_add_executor_job(
-                self._get_load
+            # Total load and the CSV reports are refreshed on their own
+            # cadence: total load every 5 min (ISO-NE's own interval), zone
+            # load every 10 min, the seven-day forecast (capacity and alerts)
+            # every 30 min
+            fetches = {}
+            if (self.last_load_update is None or 
+                (now - self.last_load_update).total_seconds() >= _LOAD_TTL - _LOAD_TTL_SLACK):
+                _LOGGER.debug("Fetching ISO-NE total load")
+                fetches["load"] = self._async_run_blocking(self._get_load)
+            # A report URL waiting out a failure backoff is not fetched, so
+            # its previous cached values stay in place
+            if self.zone and self.zone_code and (
+                self.last_zone_update is None or 
+                (now - self.last_zone_update).total_seconds() >= _ZONE_CSV_TTL
+            ) and not self._in_backoff("zone_load", self._zone_load_url(now), now):
+                _LOGGER.debug("Fetching zone load from CSV")
+                fetches["zone_load"] = self._get_zone_load_csv(now)
+            if (self.last_forecast_update is None or 
+                (now - self.last_forecast_update).total_seconds() >= _SDF_CSV_TTL
+            ) and not self._in_backoff("sdf", self._sdf_url(now), now):
+                _LOGGER.debug("Fetching capacity and forecast alerts from CSV")
+                fetches["sdf"] = self._get_sdf_csv(now)
+            
+            # Status (web scrape, more reliable than API; every update) and the
+            # due fetches are independent, so fetch them concurrently
+            _LOGGER.debug("Fetching ISO-NE system status")
+            status_data, *results = await asyncio.gather(
+                self._get_status_from_web(),
+                *fetches.values(),
             )
-            data["load"] = load_data
+            fetched = dict(zip(fetches, results))
+            
+            if "load" in fetched:
+                self.cached_load = fetched["load"]
+                # Failed fetches are retried on the next update
+                if self.cached_load.get("total_load") is not None:
+                    self.last_load_update = now
+            if "zone_load" in fetched:
+                self.cached_zone_load = fetched["zone_load"]
+                self.last_zone_update = now
+            if "sdf" in fetched:
+                sdf = fetched["sdf"]
+                self.cached_capacity = self._get_capacity(sdf)
+                self.cached_forecast_alerts = self._get_forecast_alerts(sdf, now)
+                self.last_capacity_update = now
+                self.last_capacity_update_iso = now.isoformat()
+                self.last_forecast_update = now
             
-            # Get zone load from CSV (every 10 min)
+            data["status"] = status_data
+            # Copied so the zone load below does not touch the cached reading
+            data["load"] = load_data = dict(self.cached_load)
             if self.zone and self.zone_code:
-                if (self.last_zone_update is None or 
-                    (now - self.last_zone_update).total_seconds() >= 600):
-                    _LOGGER.debug("Fetching zone load from CSV")
-                    zone_load = await self._get_zone_load_csv()
-                    self.cached_zone_load = zone_load
-                    self.last_zone_update = now
                 data["load"]["zone_load"] = self.cached_zone_load
-            
-            # Get capacity from CSV (every 30 min)
-            if (self.last_capacity_update is None or 
-                (now - self.last_capacity_update).total_seconds() >= 1800):
-                _LOGGER.debug("Fetching capacity from CSV")
-                capacity = await self._get_capacity_csv()
-                self.cached_capacity = capacity
-                self.last_capacity_update = now
             data["capacity"] = self.cached_capacity
             
             # Calculate capacity margin
-            if data.get("capacity") and data["load"].get("total_load"):
-                margin = ((data["capacity"] - data["load"]["total_load"]) / 
-                         data["capacity"] * 100)
-                data["capacity_margin"] = round(margin, 1)
-            else:
-                data["capacity_margin"] = None
+            capacity = self.cached_capacity
+            total_load = load_data.get("total_load")
+            data["capacity_margin"] = (
+                round((capacity - total_load) / capacity * 100, 1)
+                if capacity and total_load else None
+            )
+            data["capacity_breakdown"] = (
+                {
+                    "available_mw": round(capacity - total_load, 1),
+                    "capacity_mw": round(capacity, 1),
+                    ATTR_LOAD_MW: round(total_load, 1),
+                }
+                if capacity and total_load else None
+            )
             
-            # Get forecast alerts from CSV (every 30 min)
-            if (self.last_forecast_update is None or 
-                (now - self.last_forecast_update).total_seconds() >= 1800):
-                _LOGGER.debug("Fetching forecast alerts from CSV")
-                forecast_alerts = await self._get_forecast_alerts_csv()
-                self.cached_forecast_alerts = forecast_alerts
-                self.last_forecast_update = now
             data["forecast_alerts"] = self.cached_forecast_alerts
             
             # Parse status for alerts
-            data["parsed_status"] = self._parse_status(status_data)
+            data["parsed_status"] = parse_status(status_data)
+            
+            # Pre-extracted sections shared by every entity
+            parsed_status = data["parsed_status"]
+            op4_action = parsed_status["op4_action"]
+            self.snapshot = ISONESnapshot(
+                self.cached_forecast_alerts or _EMPTY_SNAPSHOT.forecast_alerts,
+                data["capacity"],
+                data["capacity_margin"],
+                data["capacity_breakdown"],
+                total_load=total_load,
+                load_timestamp=load_data.get("timestamp"),
+                zone_load=load_data.get("zone_load"),
+                status=parsed_status["status"],
+                severity=parsed_status["severity"],
+                op4_action=op4_action,
+                op4_description=get_op4_action(op4_action) if op4_action else None,
+                eea_level=parsed_status["eea_level"],
+                description=parsed_status["description"],
+                is_emergency=parsed_status["is_emergency"],
+            )
             
             _LOGGER.debug("Successfully updated ISO-NE data")
             return data
@@ -137,25 +333,37 @@ class ISONEDataCoordinator(DataUpdateCoordinator):
             _LOGGER.error("Error fetching ISO-NE data: %s", err)
             raise UpdateFailed(f"Error communicating with ISO-NE API: {err}") from err
 
+    def _conditional_headers(self, kind: str, url: str) -> dict[str, str]:
+        """Return conditional GET headers from the last response for this report."""
+        cached = self._http_cache.get(kind)
+        if cached is None or cached[0] != url:
+            return {}
+        
+        headers = {}
+        if cached[1]:
+            headers["If-None-Match"] = cached[1]
+        if cached[2]:
+            headers["If-Modified-Since"] = cached[2]
+        return headers
+
     async def _get_status_from_web(self) -> dict[str, Any]:
         """Get current system status by scraping ISO-NE website (PRIMARY METHOD)."""
         try:
             url = "https://www.iso-ne.com/markets-operations/system-forecast-status/current-system-status/"
             
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status != 200:
-                        _LOGGER.warning(f"Web scraping failed with HTTP {response.status}, falling back to gridstatus API")
-                        return await self.hass.async_add_executor_job(self._get_status_from_api)
-                    
-                    html = await response.text()
+            async with self.session.get(url, timeout=10) as response:
+                if response.status != 200:
+                    _LOGGER.warning(f"Web scraping failed with HTTP {response.status}, falling back to gridstatus API")
+                    return await self._async_run_blocking(self._get_status_from_api)
+                
+                html = await response.text()
             
             # Parse HTML with BeautifulSoup
             try:
                 from bs4 import BeautifulSoup
             except ImportError:
                 _LOGGER.error("BeautifulSoup not available, falling back to gridstatus API")
-                return await self.hass.async_add_executor_job(self._get_status_from_api)
+                return await self._async_run_blocking(self._get_status_from_api)
             
             soup = BeautifulSoup(html, 'html.parser')
             
@@ -163,18 +371,18 @@ class ISONEDataCoordinator(DataUpdateCoordinator):
             tables = soup.find_all('table')
             if not tables:
                 _LOGGER.warning("No status table found on webpage, falling back to gridstatus API")
-                return await self.hass.async_add_executor_job(self._get_status_from_api)
+                return await self._async_run_blocking(self._get_status_from_api)
             
             # Get the second row (first data row with actual status)
             rows = tables[0].find_all('tr')
             if len(rows) < 2:
                 _LOGGER.warning("Status table has insufficient rows, falling back to gridstatus API")
-                return await self.hass.async_add_executor_job(self._get_status_from_api)
+                return await self._async_run_blocking(self._get_status_from_api)
             
             cells = rows[1].find_all(['td', 'th'])
             if len(cells) < 2:
                 _LOGGER.warning("Status table has insufficient cells, falling back to gridstatus API")
-                return await self.hass.async_add_executor_job(self._get_status_from_api)
+                return await self._async_run_blocking(self._get_status_from_api)
             
             # Extract status from second cell
             status_text = cells[1].get_text(strip=True)
@@ -193,7 +401,7 @@ class ISONEDataCoordinator(DataUpdateCoordinator):
             
         except Exception as err:
             _LOGGER.error(f"Error scraping web status: {err}, falling back to gridstatus API")
-            return await self.hass.async_add_executor_job(self._get_status_from_api)
+            return await self._async_run_blocking(self._get_status_from_api)
 
     def _get_status_from_api(self) -> dict[str, Any]:
         """Get current system status from gridstatus API (FALLBACK METHOD)."""
@@ -203,16 +411,15 @@ class ISONEDataCoordinator(DataUpdateCoordinator):
                 _LOGGER.warning("⚠️  No status data returned from gridstatus API")
                 return {"status": STATUS_NORMAL, "source": "api_empty", "raw": None}
             
-            # Convert DataFrame to dict for easier handling
-            status_dict = status.to_dict('records')[0] if len(status) > 0 else {}
-            status_text = status_dict.get("Status", STATUS_NORMAL)
+            # Read the one field needed straight from the first row
+            status_text = status.iloc[0].get("Status", STATUS_NORMAL)
             
             _LOGGER.info(f"⚠️  Status obtained via GRIDSTATUS API (fallback): {status_text}")
             
             return {
                 "status": status_text,
                 "source": "api_gridstatus",
-                "raw": status_dict
+                "raw": {"Status": status_text}
             }
             
         except Exception as err:
@@ -233,12 +440,18 @@ class ISONEDataCoordinator(DataUpdateCoordinator):
                 _LOGGER.warning("No load data returned from ISO-NE")
                 return {"total_load": None, "zone_load": None}
             
-            # Get the most recent load reading
-            latest_load = load.iloc[-1]
+            # Positions of the Load and Time columns, reused while gridstatus
+            # returns the same layout
+            columns = tuple(load.columns)
+            if self._load_columns is None or self._load_columns[0] != columns:
+                positions = {col: i for i, col in enumerate(columns)}
+                self._load_columns = (columns, positions.get("Load"), positions.get("Time"))
+            _, load_idx, time_idx = self._load_columns
             
+            # Get the most recent load reading
             return {
-                "total_load": latest_load.get("Load"),
-                "timestamp": latest_load.get("Time"),
+                "total_load": load.iat[-1, load_idx] if load_idx is not None else None,
+                "timestamp": load.iat[-1, time_idx] if time_idx is not None else None,
                 "zone_load": None,  # Will be filled by CSV data
             }
             
@@ -246,312 +459,264 @@ class ISONEDataCoordinator(DataUpdateCoordinator):
             _LOGGER.error(f"Error fetching load: {err}")
             return {"total_load": None, "zone_load": None, "error": str(err)}
 
-    async def _get_zone_load_csv(self) -> float | None:
+    def _get_date_str(self, now: datetime) -> str:
+        """Return the YYYYMMDD report date for now."""
+        today = now.date()
+        if today != self._date_str_day:
+            self._date_str = now.strftime("%Y%m%d")
+            self._date_str_day = today
+        return self._date_str
+
+    def _in_backoff(self, kind: str, url: str, now: datetime) -> bool:
+        """Return True while a failing report URL waits out its backoff."""
+        backoff = self._fail_backoff.get(kind)
+        if backoff is not None and backoff[0] == url and backoff[2] > now:
+            _LOGGER.debug(f"Skipping {url} until {backoff[2]} after {backoff[1]} failures")
+            return True
+        return False
+
+    def _record_failure(self, kind: str, url: str, now: datetime, ttl: int) -> None:
+        """Double the retry delay for a failing report URL, up to the cap.
+
+        The first failure waits one refresh interval (ttl).
+        """
+        backoff = self._fail_backoff.get(kind)
+        failures = backoff[1] + 1 if backoff is not None and backoff[0] == url else 1
+        delay = min(_MAX_BACKOFF_SECONDS, ttl * 2 ** (failures - 1))
+        self._fail_backoff[kind] = (url, failures, now + timedelta(seconds=delay))
+
+    def _zone_load_url(self, now: datetime) -> str:
+        """Return today's zone load CSV URL."""
+        # Format: WW_RT_ACTUAL_LOADS_YYYYMMDD.csv
+        date_str = self._get_date_str(now)
+        return f"https://www.iso-ne.com/static-transform/csv/histRpts/rt-load/WW_RT_ACTUAL_LOADS_{date_str}.csv"
+
+    def _sdf_url(self, now: datetime) -> str:
+        """Return the seven-day forecast CSV URL starting today."""
+        return f"https://www.iso-ne.com/transform/csv/sdf?start={self._get_date_str(now)}"
+
+    async def _get_zone_load_csv(self, now: datetime) -> float | None:
         """Fetch zone load from ISO-NE CSV."""
+        date_str = self._get_date_str(now)
+        url = self._zone_load_url(now)
+        
         try:
-            # Format: WW_RT_ACTUAL_LOADS_YYYYMMDD.csv
-            date_str = datetime.now().strftime("%Y%m%d")
-            url = f"https://www.iso-ne.com/static-transform/csv/histRpts/rt-load/WW_RT_ACTUAL_LOADS_{date_str}.csv"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status != 200:
-                        _LOGGER.warning(f"Failed to fetch zone load CSV: HTTP {response.status}")
-                        return None
-                    
-                    csv_text = await response.text()
-                    
-            # Parse CSV
-            df = pd.read_csv(io.StringIO(csv_text))
-            
-            # Find the column for our zone (e.g., ".H.NEWHAMPSHIRE")
-            zone_column = None
-            for col in df.columns:
-                if self.zone.upper() in col.upper():
-                    zone_column = col
-                    break
-            
-            if not zone_column:
-                _LOGGER.warning(f"Zone column not found for {self.zone}")
-                return None
-            
-            # Get most recent value
-            latest_value = df[zone_column].iloc[-1]
-            return float(latest_value) if pd.notna(latest_value) else None
+            # Once today's header row is known, only the tail of the file is
+            # needed for the latest reading
+            headers = self._conditional_headers("zone_load", url)
+            header_line = None
+            if self._zone_csv_header and self._zone_csv_header[0] == date_str:
+                header_line = self._zone_csv_header[1]
+                headers["Range"] = f"bytes=-{_ZONE_CSV_TAIL_BYTES}"
+                headers["Accept-Encoding"] = "identity"
+            
+            async with self.session.get(url, headers=headers, timeout=10) as response:
+                if response.status == 304:
+                    # Not republished since the last fetch
+                    self._fail_backoff.pop("zone_load", None)
+                    return self._http_cache["zone_load"][3]
+                if response.status not in (200, 206):
+                    _LOGGER.warning(f"Failed to fetch zone load CSV: HTTP {response.status}")
+                    self._record_failure("zone_load", url, now, _ZONE_CSV_TTL)
+                    return None
+                
+                csv_bytes = await _read_csv_body(response)
+                partial = response.status == 206
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+            
+            full_header_line = None
+            if partial and header_line is not None:
+                # Drop the first (likely truncated) line and restore the header
+                csv_bytes = header_line + csv_bytes[csv_bytes.find(b"\n") + 1:]
+            else:
+                # Full file: its header row is remembered for tail requests
+                # only once the zone column has been found in it
+                newline = csv_bytes.find(b"\n")
+                if newline != -1:
+                    full_header_line = csv_bytes[:newline + 1]
+                self._zone_csv_header = None
+            
+            reader = csv.reader(io.StringIO(csv_bytes.decode("utf-8-sig")))
+            header = tuple(next(reader, ()))
+            
+            # Find the column for our zone (e.g., ".H.NEWHAMPSHIRE"); the
+            # index is reused while the header row stays the same
+            if self._zone_column is not None and self._zone_column[0] == header:
+                idx = self._zone_column[1]
+            else:
+                zone_upper = self.zone.upper()
+                idx = next(
+                    (i for i, col in enumerate(header) if zone_upper in col.upper()),
+                    None,
+                )
+                if idx is None:
+                    _LOGGER.warning(f"Zone column not found for {self.zone}")
+                    # Re-read the full file on the next fetch
+                    self._zone_csv_header = None
+                    self._zone_column = None
+                    return None
+                self._zone_column = (header, idx)
+            if full_header_line is not None:
+                self._zone_csv_header = (date_str, full_header_line)
+            
+            # Most recent non-empty value in the zone column
+            latest_value = None
+            for row in reader:
+                if len(row) > idx and row[idx]:
+                    latest_value = row[idx]
+            zone_load = float(latest_value) if latest_value is not None else None
+            self._http_cache["zone_load"] = (url, etag, last_modified, zone_load)
+            self._fail_backoff.pop("zone_load", None)
+            return zone_load
             
         except Exception as err:
             _LOGGER.error(f"Error fetching zone load CSV: {err}")
+            self._record_failure("zone_load", url, now, _ZONE_CSV_TTL)
             return None
 
-    async def _get_capacity_csv(self) -> float | None:
-        """Fetch system capacity from ISO-NE CSV."""
+    async def _get_sdf_csv(
+        self, now: datetime
+    ) -> tuple[list[str], dict[str, list[str]]] | None:
+        """Fetch the ISO-NE seven-day forecast CSV.
+
+        Capacity and forecast alerts both come from this report, so it is
+        fetched and parsed once for both.
+        """
+        url = self._sdf_url(now)
+        
         try:
-            date_str = datetime.now().strftime("%Y%m%d")
-            url = f"https://www.iso-ne.com/transform/csv/sdf?start={date_str}"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status != 200:
-                        _LOGGER.warning(f"Failed to fetch capacity CSV: HTTP {response.status}")
-                        return 31500.0
-                    
-                    csv_text = await response.text()
-            
-            # Parse the CSV data
-            lines = csv_text.split('\n')
-            data = {}
-            
-            for line in lines:
-                if not line.strip():
-                    continue
-                
-                # Parse CSV line (handle quoted values)
-                parts = [p.strip('"') for p in re.split(',(?=(?:[^"]*"[^"]*")*[^"]*$)', line)]
-                
-                if len(parts) > 1 and parts[0] == "D":
-                    label = parts[1]
-                    values = parts[2:] if len(parts) > 2 else []
-                    if label and values and "Total Available Generation and Imports" in label:
-                        try:
-                            # Get first day's capacity
-                            capacity = float(values[0].replace(',', ''))
-                            return capacity
-                        except (ValueError, IndexError):
-                            pass
-            
-            # Fallback to static value if not found
-            return 31500.0
+            headers = self._conditional_headers("sdf", url)
+            async with self.session.get(url, headers=headers, timeout=10) as response:
+                if response.status == 304:
+                    # Not republished since the last fetch
+                    self._fail_backoff.pop("sdf", None)
+                    return self._http_cache["sdf"][3]
+                if response.status != 200:
+                    _LOGGER.warning(f"Failed to fetch forecast CSV: HTTP {response.status}")
+                    self._record_failure("sdf", url, now, _SDF_CSV_TTL)
+                    return None
                 
+                csv_bytes = await _read_csv_body(response)
+                etag = response.headers.get("ETag")
+                last_modified = response.headers.get("Last-Modified")
+            
+            sdf = _parse_sdf_csv(csv_bytes.decode("utf-8-sig"))
+            self._http_cache["sdf"] = (url, etag, last_modified, sdf)
+            self._fail_backoff.pop("sdf", None)
+            return sdf
+            
         except Exception as err:
-            _LOGGER.error(f"Error fetching capacity CSV: {err}")
-            return 31500.0
+            _LOGGER.error(f"Error fetching forecast CSV: {err}")
+            self._record_failure("sdf", url, now, _SDF_CSV_TTL)
+            return None
+
+    def _get_capacity(
+        self, sdf: tuple[list[str], dict[str, list[str]]] | None
+    ) -> float:
+        """Get system capacity from the seven-day forecast."""
+        # Fallback to static value if not found
+        capacity = 31500.0
+        if sdf is None:
+            return capacity
+        
+        _, data = sdf
+        for label, values in data.items():
+            if "Total Available Generation and Imports" in label:
+                try:
+                    # Get first day's capacity
+                    capacity = float(values[0].replace(',', ''))
+                    break
+                except (ValueError, IndexError):
+                    pass
+        
+        return capacity
 
-    async def _get_forecast_alerts_csv(self) -> dict[str, Any]:
-        """Fetch 7-day capacity forecast and parse for alerts."""
+    def _get_forecast_alerts(
+        self, sdf: tuple[list[str], dict[str, list[str]]] | None, now: datetime
+    ) -> dict[str, Any]:
+        """Analyze the seven-day forecast for upcoming capacity issues."""
+        if sdf is None:
+            return {
+                "alerts": [],
+                "has_alerts": False,
+                "forecast_checked": now.isoformat()
+            }
+        
         try:
-            date_str = datetime.now().strftime("%Y%m%d")
-            url = f"https://www.iso-ne.com/transform/csv/sdf?start={date_str}"
-            
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url, timeout=10) as response:
-                    if response.status != 200:
-                        _LOGGER.warning(f"Failed to fetch forecast CSV: HTTP {response.status}")
-                        return {
-                            "alerts": [],
-                            "has_alerts": False,
-                            "forecast_checked": datetime.now().isoformat()
-                        }
-                    
-                    csv_text = await response.text()
-            
-            # Parse the CSV data
-            lines = csv_text.split('\n')
-            data = {}
-            days = []
-            
-            for line in lines:
-                if not line.strip():
-                    continue
-                
-                # Parse CSV line (handle quoted values)
-                parts = [p.strip('"') for p in re.split(',(?=(?:[^"]*"[^"]*")*[^"]*$)', line)]
-                
-                if not parts:
-                    continue
-                
-                line_type = parts[0]
-                
-                if line_type == "H" and len(parts) > 2:
-                    days = parts[2:]
-                
-                elif line_type == "D" and len(parts) > 1:
-                    label = parts[1]
-                    values = parts[2:] if len(parts) > 2 else []
-                    if label and values:
-                        data[label] = values
+            days, data = sdf
             
-            # Analyze for capacity issues
+            # Analyze for capacity issues; alerts_by_day indexes the same
+            # entries by days ahead for merging
             alerts = []
+            alerts_by_day: dict[int, dict[str, Any]] = {}
             
             # Check capacity margins
             if "Total Capacity Supply Obligation (CSO)" in data and "Total Available Generation and Imports" in data:
-                cso = data["Total Capacity Supply Obligation (CSO)"]
-                available = data["Total Available Generation and Imports"]
+                cso = _sdf_row_to_mw(data["Total Capacity Supply Obligation (CSO)"], len(days))
+                available = _sdf_row_to_mw(data["Total Available Generation and Imports"], len(days))
+                count = min(len(cso), len(available))
+                cso, available = cso[:count], available[:count]
                 
-                for i, day in enumerate(days):
-                    if i < len(cso) and i < len(available):
-                        try:
-                            cso_val = float(cso[i].replace(',', ''))
-                            avail_val = float(available[i].replace(',', ''))
-                            margin = ((avail_val - cso_val) / cso_val * 100)
-                            
-                            if margin < 5:
-                                alerts.append({
-                                    "date": day,
-                                    "days_ahead": i,
-                                    "alerts": [{
-                                        "type": "Critical Reserve Margin" if margin < 0 else "Low Reserve Margin",
-                                        "message": f"Reserve margin: {margin:.1f}% (Available: {avail_val:,.0f} MW, Required: {cso_val:,.0f} MW)",
-                                        "keyword": "capacity"
-                                    }],
-                                    "alert_count": 1
-                                })
-                        except (ValueError, IndexError):
-                            pass
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    margins = (available - cso) / cso * 100
+                
+                # NaN margins (non-numeric cells) compare False and are skipped
+                for i in np.flatnonzero(margins < 5):
+                    margin, avail_val, cso_val = margins[i], available[i], cso[i]
+                    entry = {
+                        "date": days[i],
+                        "days_ahead": int(i),
+                        "alerts": [{
+                            "type": "Critical Reserve Margin" if margin < 0 else "Low Reserve Margin",
+                            "message": f"Reserve margin: {margin:.1f}% (Available: {avail_val:,.0f} MW, Required: {cso_val:,.0f} MW)",
+                            "keyword": "capacity"
+                        }],
+                        "alert_count": 1
+                    }
+                    alerts.append(entry)
+                    alerts_by_day[int(i)] = entry
             
             # Check for high cold weather outages
             if "Anticipated Cold Weather Outages" in data:
-                outages = data["Anticipated Cold Weather Outages"]
-                for i, day in enumerate(days):
-                    if i < len(outages):
-                        try:
-                            outage_val = float(outages[i].replace(',', ''))
-                            if outage_val > 3000:
-                                day_alert = next((a for a in alerts if a["days_ahead"] == i), None)
-                                if day_alert:
-                                    day_alert["alerts"].append({
-                                        "type": "High Cold Weather Outages",
-                                        "message": f"{outage_val:,.0f} MW offline due to cold weather",
-                                        "keyword": "outage"
-                                    })
-                                    day_alert["alert_count"] += 1
-                                else:
-                                    alerts.append({
-                                        "date": day,
-                                        "days_ahead": i,
-                                        "alerts": [{
-                                            "type": "High Cold Weather Outages",
-                                            "message": f"{outage_val:,.0f} MW offline due to cold weather",
-                                            "keyword": "outage"
-                                        }],
-                                        "alert_count": 1
-                                    })
-                        except (ValueError, IndexError):
-                            pass
+                outages = _sdf_row_to_mw(data["Anticipated Cold Weather Outages"], len(days))
+                for i in np.flatnonzero(outages > 3000):
+                    outage_val = outages[i]
+                    day_alert = alerts_by_day.get(int(i))
+                    if day_alert:
+                        day_alert["alerts"].append({
+                            "type": "High Cold Weather Outages",
+                            "message": f"{outage_val:,.0f} MW offline due to cold weather",
+                            "keyword": "outage"
+                        })
+                        day_alert["alert_count"] += 1
+                    else:
+                        entry = {
+                            "date": days[i],
+                            "days_ahead": int(i),
+                            "alerts": [{
+                                "type": "High Cold Weather Outages",
+                                "message": f"{outage_val:,.0f} MW offline due to cold weather",
+                                "keyword": "outage"
+                            }],
+                            "alert_count": 1
+                        }
+                        alerts.append(entry)
+                        alerts_by_day[int(i)] = entry
             
-            return {
+            forecast_alerts = {
                 "alerts": alerts,
                 "has_alerts": len(alerts) > 0,
                 "total_alerts": sum(a["alert_count"] for a in alerts),
-                "forecast_checked": datetime.now().isoformat()
+                "forecast_checked": now.isoformat()
             }
+            return forecast_alerts
             
         except Exception as err:
-            _LOGGER.error(f"Error fetching forecast alerts: {err}")
+            _LOGGER.error(f"Error analyzing forecast alerts: {err}")
             return {
                 "alerts": [],
                 "has_alerts": False,
                 "error": str(err),
-                "forecast_checked": datetime.now().isoformat()
+                "forecast_checked": now.isoformat()
             }
-
-    def _parse_status(self, status_data: dict[str, Any]) -> dict[str, Any]:
-        """Parse status data to extract meaningful alerts."""
-        status_text = status_data.get("status", STATUS_NORMAL)
-        source = status_data.get("source", "unknown")
-        raw_data = status_data.get("raw", {})
-        
-        parsed = {
-            "status": status_text,
-            "severity": SEVERITY_NORMAL,
-            "op4_action": None,
-            "eea_level": None,
-            "description": "Grid operating normally",
-            "is_emergency": False,
-            "data_source": source,  # Track where status came from
-        }
-        
-        # Normalize status text for parsing
-        status_lower = status_text.lower()
-        
-        # Check for OP-7 Emergency
-        if "op-7" in status_lower or "op7" in status_lower or "load shed" in status_lower:
-            parsed["status"] = STATUS_OP7
-            parsed["severity"] = SEVERITY_EMERGENCY
-            parsed["description"] = "Emergency - Load shedding may occur"
-            parsed["is_emergency"] = True
-            
-        # Check for EEA levels
-        elif "eea" in status_lower or "energy emergency alert" in status_lower:
-            if "eea 3" in status_lower or "eea level 3" in status_lower:
-                parsed["status"] = STATUS_EEA3
-                parsed["eea_level"] = 3
-                parsed["severity"] = SEVERITY_EMERGENCY
-                parsed["description"] = "Energy Emergency Alert Level 3"
-                parsed["is_emergency"] = True
-            elif "eea 2" in status_lower or "eea level 2" in status_lower:
-                parsed["status"] = STATUS_EEA2
-                parsed["eea_level"] = 2
-                parsed["severity"] = SEVERITY_POWER_WARNING
-                parsed["description"] = "Energy Emergency Alert Level 2"
-                parsed["is_emergency"] = True
-            elif "eea 1" in status_lower or "eea level 1" in status_lower:
-                parsed["status"] = STATUS_EEA1
-                parsed["eea_level"] = 1
-                parsed["severity"] = SEVERITY_OP4_EARLY
-                parsed["description"] = "Energy Emergency Alert Level 1"
-                parsed["is_emergency"] = False
-                
-        # Check for OP-4 actions
-        elif "op-4" in status_lower or "op4" in status_lower:
-            action_num = self._extract_op4_action(status_text)
-            parsed["status"] = STATUS_OP4
-            parsed["op4_action"] = action_num
-            
-            if action_num:
-                if action_num >= 10:
-                    parsed["severity"] = SEVERITY_EMERGENCY
-                    parsed["is_emergency"] = True
-                    parsed["description"] = f"OP-4 Action {action_num} - Critical"
-                elif action_num >= 6:
-                    parsed["severity"] = SEVERITY_POWER_WARNING
-                    parsed["is_emergency"] = True
-                    parsed["description"] = f"OP-4 Action {action_num} - Power Warning"
-                elif action_num >= 4:
-                    parsed["severity"] = SEVERITY_POWER_WATCH
-                    parsed["is_emergency"] = False
-                    parsed["description"] = f"OP-4 Action {action_num} - Power Watch"
-                else:
-                    parsed["severity"] = SEVERITY_OP4_EARLY
-                    parsed["is_emergency"] = False
-                    parsed["description"] = f"OP-4 Action {action_num} - Early Warning"
-            else:
-                parsed["severity"] = SEVERITY_OP4_EARLY
-                parsed["description"] = "OP-4 Capacity Deficiency Procedure Active"
-                
-        # Check for M/LCC 2 Alert
-        elif "m/lcc" in status_lower or "mlcc" in status_lower or "abnormal" in status_lower:
-            parsed["status"] = STATUS_MLCC2
-            parsed["severity"] = SEVERITY_MLCC2
-            parsed["description"] = "Abnormal conditions alert"
-            
-        # Check for Power Watch/Warning/Caution
-        elif "power warning" in status_lower:
-            parsed["severity"] = SEVERITY_POWER_WARNING
-            parsed["is_emergency"] = True
-            parsed["description"] = "Power Warning - Immediate reduction needed"
-        elif "power watch" in status_lower:
-            parsed["severity"] = SEVERITY_POWER_WATCH
-            parsed["description"] = "Power Watch - Conservation may be needed"
-        elif "power caution" in status_lower:
-            parsed["severity"] = SEVERITY_OP4_EARLY
-            parsed["description"] = "Power Caution - Resources on alert"
-            
-        return parsed
-
-    def _extract_op4_action(self, status_text: str) -> int | None:
-        """Extract OP-4 action number from status text."""
-        patterns = [
-            r"action\s+(\d+)",
-            r"op-?4\s+action\s+(\d+)",
-            r"op-?4\s+(\d+)",
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, status_text.lower())
-            if match:
-                action_num = int(match.group(1))
-                if 1 <= action_num <= 11:
-                    return action_num
-        
-        return None
@@ -0,0 +1,195 @@
+"""Status text parsing for ISO-NE Grid Monitor.
+
+Kept free of Home Assistant and coordinator state so the per-update parsing
+is plain functions over the reported status.
+"""
+from __future__ import annotations
+
+from functools import lru_cache
+import re
+from typing import Any, Final
+
+from .const import (
+    OP4_ACTIONS,
+    STATUS_NORMAL,
+    STATUS_MLCC2,
+    STATUS_OP4,
+    STATUS_OP7,
+    STATUS_EEA1,
+    STATUS_EEA2,
+    STATUS_EEA3,
+    SEVERITY_NORMAL,
+    SEVERITY_MLCC2,
+    SEVERITY_OP4_EARLY,
+    SEVERITY_POWER_WATCH,
+    SEVERITY_POWER_WARNING,
+    SEVERITY_EMERGENCY,
+)
+
+# Status keywords mapped to the canonical condition they indicate, and the
+# conditions in the order they take precedence when several appear
+_STATUS_KEYWORDS = {
+    "op-7": "op7",
+    "op7": "op7",
+    "load shed": "op7",
+    "eea level 3": "eea3",
+    "eea 3": "eea3",
+    "eea level 2": "eea2",
+    "eea 2": "eea2",
+    "eea level 1": "eea1",
+    "eea 1": "eea1",
+    "energy emergency alert": "eea",
+    "eea": "eea",
+    "op-4": "op4",
+    "op4": "op4",
+    "m/lcc": "mlcc",
+    "mlcc": "mlcc",
+    "abnormal": "mlcc",
+    "power warning": "power_warning",
+    "power watch": "power_watch",
+    "power caution": "power_caution",
+}
+_STATUS_PRIORITY = {
+    key: rank
+    for rank, key in enumerate((
+        "op7", "eea3", "eea2", "eea1", "eea", "op4", "mlcc",
+        "power_warning", "power_watch", "power_caution",
+    ))
+}
+# Outcome for each condition other than OP-4, whose severity depends on the
+# action number: (status, severity, description, is_emergency, eea_level).
+# Power alerts keep the reported status text (None here), and an EEA mention
+# without a level changes nothing.
+_STATUS_TABLE: Final[dict[str, tuple[str | None, int, str, bool, int | None]]] = {
+    "op7": (STATUS_OP7, SEVERITY_EMERGENCY, "Emergency - Load shedding may occur", True, None),
+    "eea3": (STATUS_EEA3, SEVERITY_EMERGENCY, "Energy Emergency Alert Level 3", True, 3),
+    "eea2": (STATUS_EEA2, SEVERITY_POWER_WARNING, "Energy Emergency Alert Level 2", True, 2),
+    "eea1": (STATUS_EEA1, SEVERITY_OP4_EARLY, "Energy Emergency Alert Level 1", False, 1),
+    "mlcc": (STATUS_MLCC2, SEVERITY_MLCC2, "Abnormal conditions alert", False, None),
+    "power_warning": (
+        None, SEVERITY_POWER_WARNING, "Power Warning - Immediate reduction needed", True, None
+    ),
+    "power_watch": (
+        None, SEVERITY_POWER_WATCH, "Power Watch - Conservation may be needed", False, None
+    ),
+    "power_caution": (
+        None, SEVERITY_OP4_EARLY, "Power Caution - Resources on alert", False, None
+    ),
+}
+# Longest keywords first so e.g. "eea level 3" wins over its "eea" prefix
+_STATUS_RE = re.compile(
+    "|".join(re.escape(k) for k in sorted(_STATUS_KEYWORDS, key=len, reverse=True))
+)
+
+# Patterns for the OP-4 action number, tried in order
+_OP4_RES = tuple(
+    re.compile(p)
+    for p in (r"action\s+(\d+)", r"op-?4\s+action\s+(\d+)", r"op-?4\s+(\d+)")
+)
+
+
+def _classify_op4(action_num: int) -> tuple[int, bool, str]:
+    """Return severity, emergency flag and description for an OP-4 action."""
+    if action_num >= 10:
+        return SEVERITY_EMERGENCY, True, f"OP-4 Action {action_num} - Critical"
+    if action_num >= 6:
+        return SEVERITY_POWER_WARNING, True, f"OP-4 Action {action_num} - Power Warning"
+    if action_num >= 4:
+        return SEVERITY_POWER_WATCH, False, f"OP-4 Action {action_num} - Power Watch"
+    return SEVERITY_OP4_EARLY, False, f"OP-4 Action {action_num} - Early Warning"
+
+
+# Outcome per OP-4 action number 1-11, indexed directly (index 0 unused)
+_OP4_TABLE: Final = tuple(_classify_op4(n) for n in range(12))
+
+
+def _match_status_key(status_lower: str) -> str | None:
+    """Return the highest-precedence condition mentioned in lowercased status text."""
+    best = None
+    for match in _STATUS_RE.finditer(status_lower):
+        key = _STATUS_KEYWORDS[match.group()]
+        if best is None or _STATUS_PRIORITY[key] < _STATUS_PRIORITY[best]:
+            best = key
+    return best
+
+
+def parse_status(status_data: dict[str, Any]) -> dict[str, Any]:
+    """Parse status data to extract meaningful alerts.
+
+    The status rarely changes between polls, so results are memoized on the
+    status text and source; the returned dict is shared and must not be
+    mutated.
+    """
+    status_text = status_data.get("status", STATUS_NORMAL)
+    if status_text is None:
+        status_text = STATUS_NORMAL
+    source = status_data.get("source", "unknown")
+    return _parse_status_text(status_text, source)
+
+
+@lru_cache(maxsize=16)
+def _parse_status_text(status_text: str, source: str) -> dict[str, Any]:
+    """Parse one status text reported by the given source."""
+    status = status_text
+    severity = SEVERITY_NORMAL
+    op4_action = None
+    eea_level = None
+    description = "Grid operating normally"
+    is_emergency = False
+    
+    # Normalize status text for parsing
+    status_lower = status_text.lower()
+    
+    # One scan for every known keyword; the precedence matches the
+    # original check order (OP-7, EEA, OP-4, M/LCC 2, Power alerts)
+    key = _match_status_key(status_lower)
+    
+    # Check for OP-4 actions
+    if key == "op4":
+        status = STATUS_OP4
+        op4_action = extract_op4_action(status_text, status_lower)
+        if op4_action:
+            severity, is_emergency, description = _OP4_TABLE[op4_action]
+        else:
+            severity = SEVERITY_OP4_EARLY
+            description = "OP-4 Capacity Deficiency Procedure Active"
+            
+    elif key in _STATUS_TABLE:
+        # Every other condition has a fixed outcome
+        table_status, severity, description, is_emergency, eea_level = _STATUS_TABLE[key]
+        status = table_status or status_text
+        
+    return {
+        "status": status,
+        "severity": severity,
+        "op4_action": op4_action,
+        "eea_level": eea_level,
+        "description": description,
+        "is_emergency": is_emergency,
+        "data_source": source,  # Track where status came from
+    }
+
+
+def extract_op4_action(status_text: str, status_lower: str | None = None) -> int | None:
+    """Extract OP-4 action number from status text.
+
+    Callers that already lowercased the text can pass it as status_lower.
+    """
+    if status_lower is None:
+        status_lower = status_text.lower()
+    
+    for pattern in _OP4_RES:
+        match = pattern.search(status_lower)
+        if match:
+            action_num = int(match.group(1))
+            if 1 <= action_num <= 11:
+                return action_num
+    
+    return None
+
+
+def get_op4_action(action_num: int) -> str | None:
+    """Return the description for an OP-4 action number, or None if unknown."""
+    if 0 < action_num < len(OP4_ACTIONS):
+        return OP4_ACTIONS[action_num]
+    return None
@@ -1,8 +1,10 @@
 """Sensor platform for ISO-NE Grid Monitor."""
 from __future__ import annotations
 
+from collections.abc import Mapping
 from datetime import datetime
 import logging
+from types import MappingProxyType
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -12,7 +14,7 @@ from homeassistant.components.sensor import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import UnitOfPower, PERCENTAGE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
@@ -21,14 +23,13 @@ from .const import (
     CONF_ZONE,
     CONF_MONITOR_SYSTEMWIDE,
     ZONES,
-    OP4_ACTIONS,
+    ZONE_NAME_SET,
     ATTR_STATUS,
     ATTR_SEVERITY,
     ATTR_DESCRIPTION,
     ATTR_ACTION_NUMBER,
     ATTR_AFFECTED_AREA,
     ATTR_TIMESTAMP,
-    ATTR_LOAD_MW,
     ATTR_EEA_LEVEL,
     STATUS_NORMAL,
 )
@@ -36,6 +37,15 @@ from .coordinator import ISONEDataCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
+# Marks a cache that has not been filled yet
+_UNSET = object()
+
+# Alert level names indexed by severity (0-5)
+_SEVERITY_NAMES = ("Normal", "Advisory", "Warning", "Watch", "Alert", "Emergency")
+
+# Shared attributes for sensors without data
+_EMPTY_ATTRS: Mapping[str, Any] = MappingProxyType({})
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -58,18 +68,25 @@ async def async_setup_entry(
         ISONEForecastAlertsSensor(coordinator, entry),
     ]
     
-    # Add zone-specific load sensor if zone is selected
-    if zone and zone != "SYSTEM_WIDE":
+    # Add zone-specific load sensor if a known zone is selected
+    if zone in ZONE_NAME_SET:
         sensors.append(ISONEZoneLoadSensor(coordinator, entry, zone))
     
     async_add_entities(sensors)
 
 
 class ISONEBaseSensor(CoordinatorEntity, SensorEntity):
-    """Base class for ISO-NE sensors."""
+    """Base class for ISO-NE sensors.
+
+    State is computed once per coordinator update by _compute and stored in
+    the _attr_ fields, so state reads do no work.
+    """
 
     _attr_has_entity_name = True
 
+    # Appended to the config entry ID to form each sensor's unique ID
+    _UID_SUFFIX = ""
+
     def __init__(
         self,
         coordinator: ISONEDataCoordinator,
@@ -78,13 +95,40 @@ class ISONEBaseSensor(CoordinatorEntity, SensorEntity):
         """Initialize the sensor."""
         super().__init__(coordinator)
         self._entry = entry
-        self._attr_device_info = {
-            "identifiers": {(DOMAIN, entry.entry_id)},
-            "name": "ISO-NE Grid Monitor",
-            "manufacturer": "ISO New England",
-            "model": "Grid Status Monitor",
-            "sw_version": "1.0.1",
-        }
+        self._attr_unique_id = entry.entry_id + self._UID_SUFFIX
+        self._attr_device_info = coordinator.device_info
+        # Snapshot the current state was computed from
+        self._snapshot_source: Any = _UNSET
+
+    def _refresh(self) -> None:
+        """Recompute the state and attributes from the coordinator snapshot.
+
+        Failed refreshes notify listeners with the previous snapshot, which
+        leaves the computed state unchanged.
+        """
+        snapshot = self.coordinator.snapshot
+        if snapshot is self._snapshot_source:
+            return
+        self._snapshot_source = snapshot
+        self._attr_native_value, self._attr_extra_state_attributes = self._compute()
+
+    def _compute(self) -> tuple[Any, Mapping[str, Any]]:
+        """Return the state and attributes for the current data.
+
+        Subclasses override this; the default reports no state.
+        """
+        return None, _EMPTY_ATTRS
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial state once subclass fields are set."""
+        await super().async_added_to_hass()
+        self._refresh()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the state before writing it."""
+        self._refresh()
+        super()._handle_coordinator_update()
 
 
 class ISONESystemStatusSensor(ISONEBaseSensor):
@@ -93,51 +137,32 @@ class ISONESystemStatusSensor(ISONEBaseSensor):
     _attr_name = "System Status"
     _attr_icon = "mdi:transmission-tower"
 
-    def __init__(
-        self,
-        coordinator: ISONEDataCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_system_status"
+    _UID_SUFFIX = "_system_status"
 
-    @property
-    def native_value(self) -> str | None:
-        """Return the state of the sensor."""
+    def _compute(self) -> tuple[str, Mapping[str, Any]]:
+        """Return the status and its details."""
         if not self.coordinator.data:
-            return STATUS_NORMAL
+            return STATUS_NORMAL, _EMPTY_ATTRS
         
-        parsed_status = self.coordinator.data.get("parsed_status", {})
-        return parsed_status.get("status", STATUS_NORMAL)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data:
-            return {}
-        
-        parsed_status = self.coordinator.data.get("parsed_status", {})
-        status_data = self.coordinator.data.get("status", {})
+        snapshot = self.coordinator.snapshot
         
         attrs = {
-            ATTR_SEVERITY: parsed_status.get("severity", 0),
-            ATTR_DESCRIPTION: parsed_status.get("description", ""),
+            ATTR_SEVERITY: snapshot.severity,
+            ATTR_DESCRIPTION: snapshot.description,
         }
         
-        if parsed_status.get("op4_action"):
-            attrs[ATTR_ACTION_NUMBER] = parsed_status["op4_action"]
-            attrs["action_description"] = OP4_ACTIONS.get(parsed_status["op4_action"], "")
+        if snapshot.op4_action:
+            attrs[ATTR_ACTION_NUMBER] = snapshot.op4_action
+            attrs["action_description"] = snapshot.op4_description or ""
         
-        if parsed_status.get("eea_level"):
-            attrs[ATTR_EEA_LEVEL] = parsed_status["eea_level"]
+        if snapshot.eea_level:
+            attrs[ATTR_EEA_LEVEL] = snapshot.eea_level
         
         # Add timestamp if available
-        load_data = self.coordinator.data.get("load", {})
-        if load_data.get("timestamp"):
-            attrs[ATTR_TIMESTAMP] = load_data["timestamp"]
+        if snapshot.load_timestamp:
+            attrs[ATTR_TIMESTAMP] = snapshot.load_timestamp
         
-        return attrs
+        return snapshot.status, attrs
 
 
 class ISONEAlertLevelSensor(ISONEBaseSensor):
@@ -147,46 +172,23 @@ class ISONEAlertLevelSensor(ISONEBaseSensor):
     _attr_icon = "mdi:alert-circle"
     _attr_state_class = SensorStateClass.MEASUREMENT
 
-    def __init__(
-        self,
-        coordinator: ISONEDataCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_alert_level"
+    _UID_SUFFIX = "_alert_level"
 
-    @property
-    def native_value(self) -> int:
-        """Return the alert level (0-5)."""
+    def _compute(self) -> tuple[int, Mapping[str, Any]]:
+        """Return the alert level (0-5) and its details."""
         if not self.coordinator.data:
-            return 0
-        
-        parsed_status = self.coordinator.data.get("parsed_status", {})
-        return parsed_status.get("severity", 0)
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data:
-            return {}
-        
-        parsed_status = self.coordinator.data.get("parsed_status", {})
-        
-        severity = parsed_status.get("severity", 0)
-        severity_names = {
-            0: "Normal",
-            1: "Advisory",
-            2: "Warning",
-            3: "Watch",
-            4: "Alert",
-            5: "Emergency",
-        }
-        
-        return {
-            "severity_name": severity_names.get(severity, "Unknown"),
-            ATTR_DESCRIPTION: parsed_status.get("description", ""),
-            "is_emergency": parsed_status.get("is_emergency", False),
+            return 0, _EMPTY_ATTRS
+        
+        snapshot = self.coordinator.snapshot
+        severity = snapshot.severity
+        
+        return severity, {
+            "severity_name": (
+                _SEVERITY_NAMES[severity]
+                if 0 <= severity < len(_SEVERITY_NAMES) else "Unknown"
+            ),
+            ATTR_DESCRIPTION: snapshot.description,
+            "is_emergency": snapshot.is_emergency,
         }
 
 
@@ -196,47 +198,27 @@ class ISONEOP4ActionSensor(ISONEBaseSensor):
     _attr_name = "OP-4 Action"
     _attr_icon = "mdi:clipboard-alert"
 
-    def __init__(
-        self,
-        coordinator: ISONEDataCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_op4_action"
-
-    @property
-    def native_value(self) -> str:
-        """Return the current OP-4 action status."""
-        if not self.coordinator.data:
-            return "None"
-        
-        parsed_status = self.coordinator.data.get("parsed_status", {})
-        action_num = parsed_status.get("op4_action")
-        
-        if action_num:
-            return f"Action {action_num}"
-        return "None"
+    _UID_SUFFIX = "_op4_action"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+    def _compute(self) -> tuple[str, Mapping[str, Any]]:
+        """Return the current OP-4 action status and its details."""
         if not self.coordinator.data:
-            return {}
+            return "None", _EMPTY_ATTRS
         
-        parsed_status = self.coordinator.data.get("parsed_status", {})
-        action_num = parsed_status.get("op4_action")
+        snapshot = self.coordinator.snapshot
+        action_num = snapshot.op4_action
         
-        attrs = {}
         if action_num:
-            attrs["action_number"] = action_num
-            attrs["action_description"] = OP4_ACTIONS.get(action_num, "Unknown action")
-            attrs[ATTR_SEVERITY] = parsed_status.get("severity", 0)
-        else:
-            attrs["action_number"] = None
-            attrs["action_description"] = "No OP-4 action in effect"
-        
-        return attrs
+            return f"Action {action_num}", {
+                ATTR_ACTION_NUMBER: action_num,
+                "action_description": snapshot.op4_description or "Unknown action",
+                ATTR_SEVERITY: snapshot.severity,
+            }
+        
+        return "None", {
+            ATTR_ACTION_NUMBER: None,
+            "action_description": "No OP-4 action in effect",
+        }
 
 
 class ISONETotalLoadSensor(ISONEBaseSensor):
@@ -248,37 +230,20 @@ class ISONETotalLoadSensor(ISONEBaseSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:lightning-bolt"
 
-    def __init__(
-        self,
-        coordinator: ISONEDataCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_total_load"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the total system load in MW."""
-        if not self.coordinator.data:
-            return None
-        
-        load_data = self.coordinator.data.get("load", {})
-        return load_data.get("total_load")
+    _UID_SUFFIX = "_total_load"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+    def _compute(self) -> tuple[float | None, Mapping[str, Any]]:
+        """Return the total system load in MW and its timestamp."""
         if not self.coordinator.data:
-            return {}
+            return None, _EMPTY_ATTRS
         
-        load_data = self.coordinator.data.get("load", {})
+        snapshot = self.coordinator.snapshot
         
         attrs = {}
-        if load_data.get("timestamp"):
-            attrs[ATTR_TIMESTAMP] = load_data["timestamp"]
+        if snapshot.load_timestamp:
+            attrs[ATTR_TIMESTAMP] = snapshot.load_timestamp
         
-        return attrs
+        return snapshot.total_load, attrs
 
 
 class ISONESystemCapacitySensor(ISONEBaseSensor):
@@ -290,35 +255,22 @@ class ISONESystemCapacitySensor(ISONEBaseSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:transmission-tower-export"
 
-    def __init__(
-        self,
-        coordinator: ISONEDataCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_system_capacity"
+    # Attributes that never change, shared by every read
+    _STATIC_ATTRS: Mapping[str, Any] = MappingProxyType({
+        ATTR_DESCRIPTION: "Available generation capacity",
+        "source": "ISO-NE 7-day forecast",
+    })
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the system capacity in MW."""
-        if not self.coordinator.data:
-            return None
-        
-        return self.coordinator.data.get("capacity")
+    _UID_SUFFIX = "_system_capacity"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        attrs = {
-            "description": "Available generation capacity",
-            "source": "ISO-NE 7-day forecast"
-        }
-        
-        if self.coordinator.last_capacity_update:
-            attrs["last_updated"] = self.coordinator.last_capacity_update.isoformat()
+    def _compute(self) -> tuple[float | None, Mapping[str, Any]]:
+        """Return the system capacity in MW and when it was fetched."""
+        capacity = self.coordinator.snapshot.capacity
+        last_update = self.coordinator.last_capacity_update_iso
+        if not last_update:
+            return capacity, self._STATIC_ATTRS
         
-        return attrs
+        return capacity, {**self._STATIC_ATTRS, "last_updated": last_update}
 
 
 class ISONECapacityMarginSensor(ISONEBaseSensor):
@@ -329,42 +281,25 @@ class ISONECapacityMarginSensor(ISONEBaseSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:gauge"
 
-    def __init__(
-        self,
-        coordinator: ISONEDataCoordinator,
-        entry: ConfigEntry,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_capacity_margin"
+    # Attributes that never change, shared by every read
+    _STATIC_ATTRS: Mapping[str, Any] = MappingProxyType({
+        ATTR_DESCRIPTION: "Available capacity headroom",
+    })
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the capacity margin percentage."""
-        if not self.coordinator.data:
-            return None
-        
-        return self.coordinator.data.get("capacity_margin")
+    _UID_SUFFIX = "_capacity_margin"
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
+    def _compute(self) -> tuple[float | None, Mapping[str, Any]]:
+        """Return the capacity margin percentage and the MW breakdown."""
+        snapshot = self.coordinator.snapshot
         if not self.coordinator.data:
-            return {}
-        
-        capacity = self.coordinator.data.get("capacity")
-        load = self.coordinator.data.get("load", {}).get("total_load")
-        
-        attrs = {
-            "description": "Available capacity headroom"
-        }
+            return snapshot.capacity_margin, _EMPTY_ATTRS
         
-        if capacity and load:
-            attrs["available_mw"] = round(capacity - load, 1)
-            attrs["capacity_mw"] = round(capacity, 1)
-            attrs["load_mw"] = round(load, 1)
+        # Rounded once per update by the coordinator
+        breakdown = snapshot.capacity_breakdown
+        if not breakdown:
+            return snapshot.capacity_margin, self._STATIC_ATTRS
         
-        return attrs
+        return snapshot.capacity_margin, {**self._STATIC_ATTRS, **breakdown}
 
 
 class ISONEZoneLoadSensor(ISONEBaseSensor):
@@ -375,6 +310,8 @@ class ISONEZoneLoadSensor(ISONEBaseSensor):
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_icon = "mdi:map-marker-radius"
 
+    _UID_SUFFIX = "_zone_load_"
+
     def __init__(
         self,
         coordinator: ISONEDataCoordinator,
@@ -384,35 +321,27 @@ class ISONEZoneLoadSensor(ISONEBaseSensor):
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
         self._zone = zone
-        self._zone_code = ZONES.get(zone, "")
         self._attr_name = f"{zone.replace('_', ' ').title()} Load"
-        self._attr_unique_id = f"{entry.entry_id}_zone_load_{zone.lower()}"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the zone load in MW."""
-        if not self.coordinator.data:
-            return None
-        
-        load_data = self.coordinator.data.get("load", {})
-        return load_data.get("zone_load")
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        attrs = {
-            "zone": self._zone,
-            "zone_code": self._zone_code,
-        }
-        
+        self._attr_unique_id += zone.lower()
+        # Fixed zone attributes, shared by every read without a timestamp;
+        # setup only creates this sensor for a zone listed in ZONES
+        self._base_attrs: Mapping[str, Any] = MappingProxyType({
+            "zone": zone,
+            "zone_code": ZONES[zone],
+        })
+
+    def _compute(self) -> tuple[float | None, Mapping[str, Any]]:
+        """Return the zone load in MW and the zone details."""
         if not self.coordinator.data:
-            return attrs
+            return None, self._base_attrs
         
-        load_data = self.coordinator.data.get("load", {})
-        if load_data.get("timestamp"):
-            attrs[ATTR_TIMESTAMP] = load_data["timestamp"]
+        snapshot = self.coordinator.snapshot
+        zone_load = snapshot.zone_load
+        timestamp = snapshot.load_timestamp
+        if not timestamp:
+            return zone_load, self._base_attrs
         
-        return attrs
+        return zone_load, {**self._base_attrs, ATTR_TIMESTAMP: timestamp}
 
 
 class ISONEForecastAlertsSensor(ISONEBaseSensor):
@@ -421,6 +350,8 @@ class ISONEForecastAlertsSensor(ISONEBaseSensor):
     _attr_name = "Forecast Alerts"
     _attr_icon = "mdi:calendar-alert"
 
+    _UID_SUFFIX = "_forecast_alerts"
+
     def __init__(
         self,
         coordinator: ISONEDataCoordinator,
@@ -428,65 +359,57 @@ class ISONEForecastAlertsSensor(ISONEBaseSensor):
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry)
-        self._attr_unique_id = f"{entry.entry_id}_forecast_alerts"
+        # The forecast is refreshed every 30 minutes, less often than the
+        # coordinator; keep the last result and the forecast it came from
+        self._forecast_source: Any = _UNSET
+        self._forecast_result: tuple[str, Mapping[str, Any]] = ("No Data", _EMPTY_ATTRS)
 
-    @property
-    def native_value(self) -> str:
-        """Return the forecast alert status."""
+    def _compute(self) -> tuple[str, Mapping[str, Any]]:
+        """Return the forecast alert status, rebuilt only for a new forecast."""
         if not self.coordinator.data:
-            return "No Data"
-        
-        forecast_data = self.coordinator.data.get("forecast_alerts", {})
-        
-        if not forecast_data or not forecast_data.get("has_alerts"):
-            return "No Alerts"
-        
-        total_alerts = forecast_data.get("total_alerts", 0)
-        alerts = forecast_data.get("alerts", [])
-        
-        if alerts:
-            # Show the nearest upcoming alert
-            nearest = alerts[0]
-            days = nearest.get("days_ahead", 0)
-            if days == 0:
-                return f"Alert Today ({total_alerts} total)"
-            elif days == 1:
-                return f"Alert Tomorrow ({total_alerts} total)"
-            else:
-                return f"Alert in {days} days ({total_alerts} total)"
+            return "No Data", _EMPTY_ATTRS
         
-        return "No Alerts"
+        forecast_data = self.coordinator.snapshot.forecast_alerts
+        if forecast_data is not self._forecast_source:
+            self._forecast_source = forecast_data
+            self._forecast_result = self._build(forecast_data)
+        return self._forecast_result
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return the state attributes."""
-        if not self.coordinator.data:
-            return {}
-        
-        forecast_data = self.coordinator.data.get("forecast_alerts", {})
+    def _build(self, forecast_data: Mapping[str, Any]) -> tuple[str, Mapping[str, Any]]:
+        """Build the state and attributes in a single pass over the forecast."""
+        has_alerts = forecast_data.get("has_alerts", False)
+        total_alerts = forecast_data.get("total_alerts", 0)
         
         attrs = {
-            "has_alerts": forecast_data.get("has_alerts", False),
-            "total_alerts": forecast_data.get("total_alerts", 0),
+            "has_alerts": has_alerts,
+            "total_alerts": total_alerts,
             "forecast_checked": forecast_data.get("forecast_checked"),
         }
         
-        # Add details for each day with alerts
-        alerts = forecast_data.get("alerts", [])
-        if alerts:
-            for idx, day in enumerate(alerts):
-                day_key = f"day_{idx}"
-                attrs[day_key] = {
-                    "date": day.get("date"),
-                    "days_ahead": day.get("days_ahead"),
-                    "alert_count": day.get("alert_count"),
-                    "alerts": [
-                        {
-                            "type": alert.get("type"),
-                            "message": alert.get("message")
-                        }
-                        for alert in day.get("alerts", [])
-                    ]
-                }
-        
-        return attrs
+        # has_alerts is only set when the alerts list is non-empty, so the
+        # usual all-clear forecast needs no per-day details
+        if not has_alerts:
+            return "No Alerts", attrs
+        
+        alerts = forecast_data["alerts"]
+        
+        # Add details for each day with alerts as flat scalar/list fields,
+        # which serialize far cheaper than nested per-day dicts
+        for idx, day in enumerate(alerts):
+            prefix = f"day_{idx}_"
+            # One pass over the day's alerts fills both lists
+            alert_types = []
+            alert_messages = []
+            for alert in day.get("alerts") or ():
+                alert_types.append(alert.get("type"))
+                alert_messages.append(alert.get("message"))
+            attrs[prefix + "date"] = day.get("date")
+            attrs[prefix + "days_ahead"] = day.get("days_ahead")
+            attrs[prefix + "alert_count"] = day.get("alert_count")
+            attrs[prefix + "alert_types"] = alert_types
+            attrs[prefix + "alert_messages"] = alert_messages
+        
+        # Show the nearest upcoming alert
+        days = alerts[0].get("days_ahead", 0)
+        when = "Today" if days == 0 else "Tomorrow" if days == 1 else f"in {days} days"
+        return f"Alert {when} ({total_alerts} total)", attrs